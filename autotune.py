@@ -0,0 +1,75 @@
+import argparse
+import logging
+import socket
+import time
+
+import mcscala2
+import prime_scalability2
+from kernel_profile import save_profile
+
+BATCH_SIZES = [1024, 4096, 16384, 65536, 262144, 1048576]
+SEGMENT_SIZES = [4096, 8192, 16384, 32768, 65536, 131072, 262144]
+
+def measure(kernel, work, repeats, **params):
+    # Best-of-N throughput in work items per second
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        kernel(**params)
+        best = min(best, time.perf_counter() - start)
+    return work / best
+
+def search(name, kernel, work, param, candidates, default_kernel, repeats):
+    # default_kernel is what the workers run without TUNED_KERNELS=1, so the gain is the one a sweep sees
+    default_throughput = measure(default_kernel, work, repeats)
+    logging.info(f'{name}: default kernel -> {default_throughput:.0f}/s')
+    results = {}
+    for value in candidates:
+        results[value] = measure(kernel, work, repeats, **{param: value})
+        logging.info(f'{name}: {param}={value} -> {results[value]:.0f}/s')
+
+    best = max(results, key=results.get)
+    gain = 100.0 * (results[best] / default_throughput - 1)
+    logging.info(f'{name}: best {param}={best} at {results[best]:.0f}/s, '
+                 f'default kernel at {default_throughput:.0f}/s ({gain:+.1f}%)')
+    return {
+        'params': {param: best},
+        'throughput': results[best],
+        'default_throughput': default_throughput,
+    }
+
+def autotune(points, prime_start, prime_range, repeats):
+    profile = {'host': socket.gethostname(), 'tuned_at': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+    if not mcscala2.load_numpy():
+        logging.warning('NumPy is not available, the Monte Carlo kernel has no batch size to tune')
+    else:
+        # Fixed seeds: without one the kernels would ask MPI for the rank
+        profile['monte_carlo'] = search(
+            'monte_carlo', lambda batch_size: mcscala2.compute_monte_carlo_batched(points, batch_size, seed=0),
+            points, 'batch_size', BATCH_SIZES, lambda: mcscala2.compute_monte_carlo(points, seed=0), repeats)
+
+    profile['primes'] = search(
+        'primes', lambda segment_size: prime_scalability2.compute_primes_segmented(prime_start, prime_start + prime_range, segment_size),
+        prime_range, 'segment_size', SEGMENT_SIZES,
+        lambda: prime_scalability2.compute_primes(prime_start, prime_start + prime_range), repeats)
+    return profile
+
+if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(
+        description='Tune the opt-in kernels for this host and store their parameters in its kernel profile. '
+                    'Run once per node, e.g. mpirun --map-by ppr:1:node python autotune.py; '
+                    'workers use the tuned kernels when started with TUNED_KERNELS=1')
+    parser.add_argument('--points', type=int, default=1000000, help='Monte Carlo points per measurement')
+    parser.add_argument('--prime-start', type=int, default=1000000, help='first number of the sieved range')
+    parser.add_argument('--prime-range', type=int, default=500000, help='numbers sieved per measurement')
+    parser.add_argument('--repeats', type=int, default=3, help='measurements per candidate, the best one counts')
+    parser.add_argument('--profile-dir', help='where to store the profile (default $KERNEL_PROFILE_DIR)')
+    args = parser.parse_args()
+
+    profile = autotune(args.points, args.prime_start, args.prime_range, args.repeats)
+    path = save_profile(profile, profile_dir=args.profile_dir)
+    logging.info(f'Written kernel profile for {profile["host"]} to {path}')
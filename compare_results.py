@@ -0,0 +1,133 @@
+import argparse
+import csv
+import logging
+import math
+import statistics
+import sys
+from collections import defaultdict
+
+# The first header column tells the two result formats apart
+WORKLOADS = {'PI': 'montecarlo', 'TotalPrimes': 'primes'}
+
+def load_results(path):
+    # Returns {(workload, size, workers): [duration_ms, ...]}
+    with open(path, newline='') as file:
+        reader = csv.reader(file, skipinitialspace=True)
+        header = next(reader)
+        workload = WORKLOADS.get(header[0], header[0])
+        size_col = header.index('Ntot')
+        workers_col = header.index('AvailableProcessors')
+        time_col = header.index('TimeDuration(ms)')
+
+        results = defaultdict(list)
+        for row in reader:
+            if not row:
+                continue
+            key = (workload, int(float(row[size_col])), int(row[workers_col]))
+            results[key].append(float(row[time_col]))
+    return results
+
+def _exact_u_distribution(n1, n2):
+    # counts[u] = number of orderings of n1 + n2 distinct values giving U = u
+    counts = {(0, n): [1] for n in range(n2 + 1)}
+    for m in range(1, n1 + 1):
+        counts[(m, 0)] = [1]
+        for n in range(1, n2 + 1):
+            dist = [0] * (m * n + 1)
+            for u, c in enumerate(counts[(m - 1, n)]):
+                dist[u + n] += c
+            for u, c in enumerate(counts[(m, n - 1)]):
+                dist[u] += c
+            counts[(m, n)] = dist
+    return counts[(n1, n2)]
+
+def mann_whitney_greater(sample, reference):
+    # One-sided Mann-Whitney U test: p-value for "sample tends to be larger than reference"
+    n1, n2 = len(sample), len(reference)
+    ranked = sorted([(value, 0) for value in sample] + [(value, 1) for value in reference])
+    ranks = [0.0] * len(ranked)
+    tie_term = 0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+
+    if tie_term == 0 and n1 * n2 <= 400:
+        dist = _exact_u_distribution(n1, n2)
+        return sum(dist[int(u):]) / sum(dist)
+
+    mean = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def compare(baseline, current, threshold, alpha):
+    rows = []
+    for key in sorted(set(baseline) | set(current)):
+        base, new = baseline.get(key), current.get(key)
+        if not base or not new:
+            rows.append((key, None, None, None, None, 'missing'))
+            continue
+        base_median, new_median = statistics.median(base), statistics.median(new)
+        change = new_median / base_median - 1 if base_median > 0 else 0.0
+        p_slower = mann_whitney_greater(new, base)
+        p_faster = mann_whitney_greater(base, new)
+        if p_slower < alpha and change > threshold:
+            status = 'regressed'
+        elif p_faster < alpha and change < -threshold:
+            status = 'improved'
+        else:
+            status = 'ok'
+        rows.append((key, base_median, new_median, change, min(p_slower, p_faster), status))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare a results CSV against a baseline and fail on regressions.')
+    parser.add_argument('baseline', help='baseline results CSV')
+    parser.add_argument('current', help='new results CSV')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='relative slowdown of the median duration that counts as a regression (default 0.05)')
+    parser.add_argument('--alpha', type=float, default=0.05,
+                        help='significance level of the Mann-Whitney U test (default 0.05)')
+    parser.add_argument('--allow-missing', action='store_true',
+                        help='do not fail when a configuration is only in one of the two files')
+    args = parser.parse_args(argv)
+
+    rows = compare(load_results(args.baseline), load_results(args.current), args.threshold, args.alpha)
+
+    print(f"{'Workload':<12}{'Size':>10}{'Workers':>9}{'Base(ms)':>12}{'New(ms)':>12}{'Change':>9}{'p':>8}  Status")
+    for (workload, size, workers), base_median, new_median, change, p_value, status in rows:
+        if status == 'missing':
+            print(f"{workload:<12}{size:>10}{workers:>9}{'':>12}{'':>12}{'':>9}{'':>8}  {status}")
+        else:
+            print(f"{workload:<12}{size:>10}{workers:>9}{base_median:>12.2f}{new_median:>12.2f}"
+                  f"{change:>+9.1%}{p_value:>8.3f}  {status}")
+
+    regressions = [row for row in rows if row[-1] == 'regressed']
+    missing = [row for row in rows if row[-1] == 'missing']
+    if regressions:
+        logging.error(f'{len(regressions)} configuration(s) regressed by more than {args.threshold:.0%}')
+    if missing and not args.allow_missing:
+        # A crashed or partial sweep must not pass the gate
+        logging.error(f'{len(missing)} configuration(s) missing from one of the files')
+    if regressions or (missing and not args.allow_missing):
+        return 1
+    logging.info('No regressions')
+    return 0
+
+if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    sys.exit(main())
@@ -0,0 +1,210 @@
+import argparse
+import importlib
+import logging
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+
+from startup import tuned_kernels_enabled
+
+# Relative compute speed and one-way link delay (seconds) of each board type.
+# A Pi Zero gets a quarter of a Pi 4's share in both master() functions.
+NODE_TYPES = {
+    'pi4': {'speed': 1.0, 'latency': 0.0003, 'jitter': 0.0002},
+    'pizero': {'speed': 0.25, 'latency': 0.002, 'jitter': 0.001},
+}
+
+# Board type of workers 1..16, mirroring the 16-worker layout of the cluster
+PROFILES = {
+    'pi-mix': ['pi4'] * 4 + ['pizero'] * 2 + ['pi4'] * 5 + ['pizero'] * 5,
+    'pi4': ['pi4'] * 16,
+    'pizero': ['pizero'] * 16,
+}
+
+WORKLOADS = {
+    'montecarlo': ('mcscala2', ('compute_monte_carlo', 'compute_monte_carlo_batched'),
+                   'strong_scalability_results.csv', 'weak_scalability_results.csv'),
+    'primes': ('prime_scalability2', ('compute_primes', 'compute_primes_segmented'),
+               'prime_scalability_results_strong.csv', 'prime_scalability_results_weak.csv'),
+}
+
+def build_profile(name, workers, stall_prob=0.0, stall_time=0.0, fail_rank=None, fail_after=None):
+    layout = PROFILES[name]
+    profile = {0: {'type': 'master', 'speed': 1.0, 'latency': 0.0, 'jitter': 0.0}}
+    for rank in range(1, workers + 1):
+        node_type = layout[(rank - 1) % len(layout)]
+        profile[rank] = dict(NODE_TYPES[node_type], type=node_type, stall_prob=stall_prob, stall_time=stall_time,
+                             fail_after=fail_after if rank == fail_rank else None)
+    return profile
+
+class LocalComm:
+    # Minimal stand-in for MPI.COMM_WORLD over multiprocessing queues (one inbox per rank)
+    def __init__(self, rank, inboxes):
+        self.rank = rank
+        self.inboxes = inboxes
+        self.pending = []
+
+    def Get_rank(self):
+        return self.rank
+
+    def Get_size(self):
+        return len(self.inboxes)
+
+    def send(self, obj, dest, tag=0):
+        self.inboxes[dest].put((self.rank, tag, obj))
+
+    def _take(self, source, tag):
+        for index, (msg_source, msg_tag, _) in enumerate(self.pending):
+            if msg_source == source and msg_tag == tag:
+                return self.pending.pop(index)[2]
+        return None
+
+    def Iprobe(self, source, tag=0):
+        while True:
+            try:
+                self.pending.append(self.inboxes[self.rank].get_nowait())
+            except queue.Empty:
+                break
+        return any(s == source and t == tag for s, t, _ in self.pending)
+
+    def recv(self, source, tag=0):
+        while not self.Iprobe(source, tag):
+            self.pending.append(self.inboxes[self.rank].get())
+        return self._take(source, tag)
+
+class EmulatedComm:
+    # Wraps a communicator and delays every message by its link's latency. The sender
+    # stamps each message with the time it may be delivered and the receiver waits
+    # for that time, so the links of one dispatch loop are delayed independently
+    # instead of adding up on the sender. TimeDuration(ms) comes from the workers'
+    # clocks and does not include the links; their delay shows up in the master's
+    # BlockWallTime(ms). recv() on the master gives up after recv_timeout seconds
+    # so a failed rank ends the sweep.
+    def __init__(self, base, profile, seed=None, recv_timeout=None):
+        self.base = base
+        self.rank = base.Get_rank()
+        self.profile = profile
+        self.node = profile[self.rank]
+        self.rng = random.Random(seed if seed is None else seed + self.rank)
+        self.recv_timeout = recv_timeout
+
+    def Get_rank(self):
+        return self.rank
+
+    def Get_size(self):
+        return self.base.Get_size()
+
+    def send(self, obj, dest, tag=0):
+        link = self.node if self.rank != 0 else self.profile[dest]
+        deliver_at = time.time() + link['latency'] + self.rng.uniform(0, link['jitter'])
+        self.base.send((deliver_at, obj), dest=dest, tag=tag)
+
+    def recv(self, source, tag=0):
+        if self.recv_timeout is not None:
+            deadline = time.monotonic() + self.recv_timeout
+            while not self.base.Iprobe(source=source, tag=tag):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f'rank {source} did not answer within {self.recv_timeout}s')
+                time.sleep(0.001)
+        deliver_at, obj = self.base.recv(source=source, tag=tag)
+        time.sleep(max(deliver_at - time.time(), 0.0))
+        return obj
+
+class EmulatedKernel:
+    # Wraps a kernel so it runs like it would on the node: stretched by the speed
+    # factor, with random stalls and an optional failure after a number of runs.
+    # The delay happens inside the call, so the workers' own timestamps include it.
+    def __init__(self, kernel, node, rank, seed=None):
+        self.kernel = kernel
+        self.node = node
+        self.rank = rank
+        self.rng = random.Random(seed if seed is None else seed + rank)
+        self.runs = 0
+
+    def __call__(self, *args, **kwargs):
+        if self.node.get('fail_after') is not None and self.runs >= self.node['fail_after']:
+            logging.error(f'Emulated failure of rank {self.rank} after {self.runs} kernel runs')
+            threading.Event().wait()
+        self.runs += 1
+
+        start = time.perf_counter()
+        result = self.kernel(*args, **kwargs)
+        delay = (time.perf_counter() - start) * (1.0 / self.node['speed'] - 1.0)
+        if self.rng.random() < self.node.get('stall_prob', 0.0):
+            logging.warning(f'Emulated stall of {self.node["stall_time"]}s on rank {self.rank}')
+            delay += self.node['stall_time']
+        time.sleep(max(delay, 0.0))
+        return result
+
+def emulate_worker(module, kernel_names, comm, profile, seed, wtime=None):
+    rank = comm.Get_rank()
+    # worker() picks its kernel by name when it starts, so swapping the module attribute is enough
+    kernel_name = kernel_names[1] if tuned_kernels_enabled() else kernel_names[0]
+    setattr(module, kernel_name, EmulatedKernel(getattr(module, kernel_name), profile[rank], rank, seed))
+    module.worker(EmulatedComm(comm, profile, seed), wtime)
+
+def _local_rank(module_name, kernel_names, rank, inboxes, profile, seed):
+    # Local ranks need no mpi4py: LocalComm carries the messages and perf_counter stands in for MPI.Wtime
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    emulate_worker(importlib.import_module(module_name), kernel_names, LocalComm(rank, inboxes), profile, seed,
+                   time.perf_counter)
+
+def run_local(module, kernel_names, tests, output_file, profile, seed, recv_timeout):
+    context = multiprocessing.get_context('spawn')
+    inboxes = [context.Queue() for _ in range(len(profile))]
+    ranks = [context.Process(target=_local_rank, args=(module.__name__, kernel_names, rank, inboxes, profile, seed), daemon=True)
+             for rank in range(1, len(profile))]
+    for process in ranks:
+        process.start()
+    try:
+        module.master(tests, output_file, EmulatedComm(LocalComm(0, inboxes), profile, seed, recv_timeout))
+    finally:
+        for process in ranks:
+            process.terminate()
+
+def run_mpi(module, kernel_names, tests, output_file, profile, seed, recv_timeout):
+    from mpi4py import MPI
+    comm = MPI.COMM_WORLD
+    if comm.Get_size() < len(profile):
+        raise SystemExit(f'the sweep needs {len(profile)} ranks, mpirun started {comm.Get_size()}')
+    if comm.Get_rank() == 0:
+        module.master(tests, output_file, EmulatedComm(comm, profile, seed, recv_timeout))
+        # Workers never leave their receive loop; tear the job down once the sweep is written
+        comm.Abort(0)
+    elif comm.Get_rank() < len(profile):
+        emulate_worker(module, kernel_names, comm, profile, seed)
+
+if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(
+        description='Run a scalability sweep against emulated Pi 4/Pi Zero nodes on one machine, '
+                    'either as local processes or under mpirun (mpirun -n 17 python emulator.py --mode mpi ...)')
+    parser.add_argument('--workload', choices=sorted(WORKLOADS), default='montecarlo')
+    parser.add_argument('--sweep', choices=['strong', 'weak'], default='weak')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='pi-mix')
+    parser.add_argument('--mode', choices=['local', 'mpi'], default='local')
+    parser.add_argument('--output-dir', default='emulator_output')
+    parser.add_argument('--stall-prob', type=float, default=0.0, help='chance that a task stalls on each worker')
+    parser.add_argument('--stall-time', type=float, default=1.0, help='length of a stall in seconds')
+    parser.add_argument('--fail-rank', type=int, help='worker that stops answering')
+    parser.add_argument('--fail-after', type=int, default=0, help='kernel runs the failing worker completes first')
+    parser.add_argument('--recv-timeout', type=float, default=600.0, help='seconds the master waits for a worker')
+    parser.add_argument('--seed', type=int, help='seed for jitter and stalls')
+    args = parser.parse_args()
+
+    module_name, kernel_names, strong_file, weak_file = WORKLOADS[args.workload]
+    module = importlib.import_module(module_name)
+    tests = module.scalability_tests_strong if args.sweep == 'strong' else module.scalability_tests_weak
+    workers = max(test['workers'] for test in tests)
+    profile = build_profile(args.profile, workers, args.stall_prob, args.stall_time, args.fail_rank, args.fail_after)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    output_file = os.path.join(args.output_dir, strong_file if args.sweep == 'strong' else weak_file)
+    logging.info(f'Emulating {workers} {args.profile} workers in {args.mode} mode, writing {output_file}')
+    run = run_local if args.mode == 'local' else run_mpi
+    run(module, kernel_names, tests, output_file, profile, args.seed, args.recv_timeout)
@@ -0,0 +1,41 @@
+import json
+import logging
+import os
+import socket
+
+# One JSON file per host, written by autotune.py and read by the workers at start-up:
+# {"host": ..., "monte_carlo": {"params": {"batch_size": ...}, "throughput": ..., "default_throughput": ...},
+#  "primes": {"params": {"segment_size": ...}, ...}}
+# default_throughput is that of the default kernel (compute_monte_carlo, compute_primes).
+def profile_path(host=None, profile_dir=None):
+    if profile_dir is None:
+        profile_dir = os.environ.get('KERNEL_PROFILE_DIR', '/home/moi/output/kernel_profiles')
+    return os.path.join(profile_dir, f'{host or socket.gethostname()}.json')
+
+def load_profile(host=None, profile_dir=None):
+    path = profile_path(host, profile_dir)
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f'Ignoring unreadable kernel profile {path}: {e}')
+        return {}
+
+def save_profile(profile, host=None, profile_dir=None):
+    path = profile_path(host, profile_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump(profile, file, indent=2)
+    return path
+
+def load_kernel_params(kernel, host=None, profile_dir=None):
+    # Keyword arguments for the kernel, or {} to keep its defaults
+    entry = load_profile(host, profile_dir).get(kernel)
+    if not entry:
+        return {}
+    params = entry.get('params', {})
+    logging.info(f'Using tuned {kernel} parameters {params} '
+                 f'({entry["throughput"]:.0f}/s tuned vs {entry["default_throughput"]:.0f}/s default kernel)')
+    return params
@@ -1,16 +1,43 @@
+from startup import ResultGatherer, StartupTimer, profiling_enabled, repetition_blocks, tuned_kernels_enabled
+
+startup_timer = StartupTimer()
+
 import os
-from mpi4py import MPI
 import random
 import time
 import csv
 import logging
+from telemetry import TELEMETRY_COLUMNS, TelemetrySampler, log_throttling, telemetry_row
+
+startup_timer.mark('imports')
+try:
+    from mpi4py import MPI
+except ImportError:
+    # Only the emulator's local mode runs without mpi4py; it passes in its own comm and clock
+    MPI = None
+else:
+    startup_timer.mark('mpi_init')
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# NumPy is only imported by workers that run the batched kernel, so the master and the
+# default kernel never pay for it
+np = None
 
-def compute_monte_carlo(total_throws):
+def load_numpy():
+    global np
+    if np is None:
+        try:
+            # numpy.random is loaded lazily by NumPy itself, so pull it in here as well
+            import numpy
+            import numpy.random
+            np = numpy
+        except ImportError:
+            np = False
+    return np
+
+def compute_monte_carlo(total_throws, seed=None):
     # Initialiser la graine aléatoire pour chaque processus
-    seed = MPI.COMM_WORLD.Get_rank() + int(MPI.Wtime() * 1000)
+    if seed is None:
+        seed = MPI.COMM_WORLD.Get_rank() + int(MPI.Wtime() * 1000)
     random.seed(seed)
 
     count_inside = 0
@@ -20,421 +47,501 @@ def compute_monte_carlo(total_throws):
             count_inside += 1
     return count_inside
 
-def master(scalability_tests, output_file):
-    comm = MPI.COMM_WORLD
+# Points drawn per NumPy batch; tuned per host by autotune.py
+DEFAULT_BATCH_SIZE = 65536
+
+def compute_monte_carlo_batched(total_throws, batch_size=DEFAULT_BATCH_SIZE, seed=None):
+    # Opt-in alternative to compute_monte_carlo (TUNED_KERNELS=1), drawing the points in NumPy batches
+    if not load_numpy():
+        return compute_monte_carlo(total_throws, seed)
+    if seed is None:
+        seed = MPI.COMM_WORLD.Get_rank() + int(MPI.Wtime() * 1000)
+    total_throws = int(total_throws)
+
+    if isinstance(seed, str):
+        # SeedSequence takes the whole stream_seed() key as entropy
+        seed = int.from_bytes(seed.encode(), 'big')
+    rng = np.random.default_rng(seed)
+    count_inside = 0
+    for offset in range(0, total_throws, batch_size):
+        n = min(batch_size, total_throws - offset)
+        x, y = rng.random(n), rng.random(n)
+        count_inside += int(np.count_nonzero(x * x + y * y <= 1.0))
+    return count_inside
+
+def stream_seed(base, rank, repetition):
+    # A key rather than a sum: summing its parts would give rank r's repetition k the
+    # same seed as rank r+1's repetition k-1 whenever both start in the same millisecond.
+    # random.seed() hashes the whole string.
+    return f'{base}:{rank}:{repetition}'
+
+def master(scalability_tests, output_file, comm=None):
+    comm = MPI.COMM_WORLD if comm is None else comm
+    gatherer = ResultGatherer(output_file, startup_timer.report(0))
 
     try:
         with open(output_file, 'w', newline='') as file:
             writer = csv.writer(file)
-            writer.writerow(['PI', 'Difference', 'Error', 'Ntot', 'AvailableProcessors', 'TimeDuration(ms)'])
+            writer.writerow(['PI', 'Difference', 'Error', 'Ntot', 'AvailableProcessors', 'TimeDuration(ms)', 'BlockWallTime(ms)'] + TELEMETRY_COLUMNS)
 
-            for test in scalability_tests:
+            # Each worker gets all repetitions of a configuration in one message
+            for test, repetitions in repetition_blocks(scalability_tests):
                 total_count = test['points']
                 num_workers = test['workers']
-                start_time = time.time()
+                # Master-side time of the whole block, dispatch and collection included
+                block_start = time.perf_counter()
 
                 # Adjust points for different types of workers
                 if num_workers == 8:
                     for i in range(1, num_workers + 1):
                         if i <= 4:  # First 4 workers (Pi 4)
-                            comm.send(total_count * 0.2, dest=i, tag=0)
+                            comm.send((total_count * 0.2, repetitions), dest=i, tag=0)
                         else:  # Next 4 workers (Pi Zero)
-                            comm.send(total_count * 0.05, dest=i, tag=0)
+                            comm.send((total_count * 0.05, repetitions), dest=i, tag=0)
                 elif num_workers == 16:
                     for i in range(1, num_workers + 1):
                         if i <= 4 or (7 <= i <= 11):  # First 4 and workers 7 to 11 (Pi 4)
-                            comm.send(total_count * 0.1, dest=i, tag=0)
+                            comm.send((total_count * 0.1, repetitions), dest=i, tag=0)
                         else:  # Workers 5-6 and 12-16 (Pi Zero)
-                            comm.send(total_count * 0.025, dest=i, tag=0)
+                            comm.send((total_count * 0.025, repetitions), dest=i, tag=0)
                 else:
                     for i in range(1, num_workers + 1):
-                        comm.send(total_count // num_workers, dest=i, tag=0)  # Default distribution
+                        comm.send((total_count // num_workers, repetitions), dest=i, tag=0)  # Default distribution
 
                 # Collect results from each worker
-                total_inside = sum(comm.recv(source=i, tag=1) for i in range(1, num_workers + 1))
-                pi_estimate = 4.0 * total_inside / total_count
-                duration = time.time() - start_time
-                error = abs(pi_estimate - 3.141592653589793)
-                difference = pi_estimate - 3.141592653589793
-                time_duration_ms = duration * 1000
+                results = gatherer.gather(comm, num_workers, f'{num_workers}w_{total_count}')
+                block_ms = (time.perf_counter() - block_start) * 1000
+
+                for repetition in range(repetitions):
+                    runs = [result['repetitions'][repetition] for result in results]
+                    telemetry = [result['telemetry'][repetition] for result in results]
+                    total_inside = sum(count for count, _, _ in runs)
+                    pi_estimate = 4.0 * total_inside / total_count
+                    # Slowest worker, measured on its own clock so hosts stay comparable
+                    duration = max(end - start for _, start, end in runs)
+                    error = abs(pi_estimate - 3.141592653589793)
+                    difference = pi_estimate - 3.141592653589793
+                    time_duration_ms = duration * 1000
+
+                    # Write to CSV
+                    writer.writerow([pi_estimate, difference, error, total_count, num_workers, time_duration_ms, block_ms] + telemetry_row(telemetry))
+                    log_throttling(telemetry, f'repetition {repetition + 1} of {num_workers} workers and {total_count} points')
+                logging.info(f'Written results of {repetitions} repetitions for {num_workers} workers and {total_count} points to {output_file}')
 
-                # Write to CSV
-                writer.writerow([pi_estimate, difference, error, total_count, num_workers, time_duration_ms])
-                logging.info(f'Written results for {num_workers} workers and {total_count} points to {output_file}')
+            gatherer.finish()
 
     except Exception as e:
         logging.error(f'Failed to write to CSV file: {e}')
 
-def worker():
-    comm = MPI.COMM_WORLD
+def worker(comm=None, wtime=None):
+    comm = MPI.COMM_WORLD if comm is None else comm
+    wtime = MPI.Wtime if wtime is None else wtime
+    sampler = TelemetrySampler()
+    # The benchmarked kernel stays the default; the tuned one has to be asked for
+    kernel, kernel_params = compute_monte_carlo, {}
+    if tuned_kernels_enabled():
+        from kernel_profile import load_kernel_params
+        kernel, kernel_params = compute_monte_carlo_batched, load_kernel_params('monte_carlo')
+        # Import NumPy now rather than inside the first timed repetition
+        load_numpy()
+    # The profiler runs for the whole receive loop; each result carries the
+    # stacks collected since the previous one (waiting, computing, pickling)
+    profiler = None
+    if profiling_enabled():
+        from profiler import StackSampler
+        profiler = StackSampler()
+        profiler.start()
+    first_task = True
     while True:
-        total_count = comm.recv(source=0, tag=0)
-        total_inside = compute_monte_carlo(total_count)
-        comm.send(total_inside, dest=0, tag=1)
+        total_count, repetitions = comm.recv(source=0, tag=0)
+        if first_task:
+            startup_timer.mark('first_task')
+        # Run the repetitions back to back, one (count, start, end) and one telemetry
+        # summary per repetition; the sampler starts and stops outside the timed span
+        base_seed = int(wtime() * 1000)
+        runs, telemetry = [], []
+        for repetition in range(repetitions):
+            sampler.start()
+            run_start = wtime()
+            total_inside = kernel(total_count, seed=stream_seed(base_seed, comm.Get_rank(), repetition), **kernel_params)
+            runs.append((total_inside, run_start, wtime()))
+            telemetry.append(sampler.stop())
+        result = {'repetitions': runs, 'telemetry': telemetry}
+        if profiler is not None:
+            result['profile'] = profiler.drain()
+        if first_task:
+            result['startup'] = startup_timer.report(comm.Get_rank())
+            first_task = False
+        comm.send(result, dest=0, tag=1)
+
+# Define your scalability tests here
+scalability_tests_strong = [
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 2},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 4},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 8},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 50000, 'workers': 16},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 2},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 4},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 8},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 500000, 'workers': 16},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 2},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 4},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 8},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 5000000, 'workers': 16},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 1},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 2},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 4},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 8},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16},
+    {'points': 50000000, 'workers': 16}
+]
+
+scalability_tests_weak = [
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 50000, 'workers': 1},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 100000, 'workers': 2},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 200000, 'workers': 4},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 400000, 'workers': 8},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 800000, 'workers': 16},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 500000, 'workers': 1},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 1000000, 'workers': 2},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 2000000, 'workers': 4},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 4000000, 'workers': 8},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 8000000, 'workers': 16},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 5000000, 'workers': 1},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 10000000, 'workers': 2},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 20000000, 'workers': 4},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 40000000, 'workers': 8},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16},
+    {'points': 80000000, 'workers': 16}
+]
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if MPI is None:
+        raise SystemExit('mpi4py is required to run the sweep (emulator.py --mode local runs it without MPI)')
     comm = MPI.COMM_WORLD
     rank = comm.Get_rank()
     size = comm.Get_size()  # Total number of processes
 
-    # Define your scalability tests here
-    scalability_tests_strong = [
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 2},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 4},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 8},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 50000, 'workers': 16},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 2},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 4},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 8},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 500000, 'workers': 16},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 2},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 4},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 8},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 5000000, 'workers': 16},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 1},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 2},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 4},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 8},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16},
-        {'points': 50000000, 'workers': 16}
-    ]
-
-    scalability_tests_weak = [
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 50000, 'workers': 1},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 100000, 'workers': 2},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 200000, 'workers': 4},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 400000, 'workers': 8},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 800000, 'workers': 16},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 500000, 'workers': 1},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 1000000, 'workers': 2},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 2000000, 'workers': 4},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 4000000, 'workers': 8},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 8000000, 'workers': 16},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 5000000, 'workers': 1},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 10000000, 'workers': 2},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 20000000, 'workers': 4},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 40000000, 'workers': 8},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16},
-        {'points': 80000000, 'workers': 16}
-    ]
-
     output_dir = '/home/moi/output'
     output_file_strong = os.path.join(output_dir, 'strong_scalability_results.csv')
     output_file_weak = os.path.join(output_dir, 'weak_scalability_results.csv')
@@ -1,10 +1,20 @@
+from startup import ResultGatherer, StartupTimer, profiling_enabled, repetition_blocks, tuned_kernels_enabled
+
+startup_timer = StartupTimer()
+
 import os
-from mpi4py import MPI
 import time
 import logging
+from telemetry import TELEMETRY_COLUMNS, TelemetrySampler, log_throttling, telemetry_row
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+startup_timer.mark('imports')
+try:
+    from mpi4py import MPI
+except ImportError:
+    # Only the emulator's local mode runs without mpi4py; it passes in its own comm and clock
+    MPI = None
+else:
+    startup_timer.mark('mpi_init')
 
 def is_prime(n):
     if n <= 1:
@@ -21,17 +31,43 @@ def compute_primes(start, end):
             count += 1
     return count
 
-def master(scalability_tests, output_file):
-    comm = MPI.COMM_WORLD
+# Numbers sieved per segment; tuned per host by autotune.py
+DEFAULT_SEGMENT_SIZE = 32768
+
+def compute_primes_segmented(start, end, segment_size=DEFAULT_SEGMENT_SIZE):
+    # Opt-in alternative to compute_primes (TUNED_KERNELS=1): a segmented sieve of
+    # Eratosthenes over [start, end), one cache-sized block at a time
+    start = max(start, 2)
+    if end <= start:
+        return 0
+    base_primes = [p for p in range(2, int((end - 1) ** 0.5) + 1) if is_prime(p)]
+
+    count = 0
+    for low in range(start, end, segment_size):
+        high = min(low + segment_size, end)
+        segment = bytearray(b'\x01') * (high - low)
+        for p in base_primes:
+            if p * p >= high:
+                break
+            first = max(p * p, -(-low // p) * p)
+            segment[first - low::p] = bytes(len(range(first - low, high - low, p)))
+        count += segment.count(1)
+    return count
+
+def master(scalability_tests, output_file, comm=None):
+    comm = MPI.COMM_WORLD if comm is None else comm
+    gatherer = ResultGatherer(output_file, startup_timer.report(0))
 
     try:
         with open(output_file, 'w') as file:
-            file.write('TotalPrimes, Ntot, AvailableProcessors, TimeDuration(ms)\n')
+            file.write(', '.join(['TotalPrimes', 'Ntot', 'AvailableProcessors', 'TimeDuration(ms)', 'BlockWallTime(ms)'] + TELEMETRY_COLUMNS) + '\n')
 
-            for test in scalability_tests:
+            # Each worker gets all repetitions of a configuration in one message
+            for test, repetitions in repetition_blocks(scalability_tests):
                 total_count = test['range']
                 num_workers = test['workers']
-                start_time = time.time()
+                # Master-side time of the whole block, dispatch and collection included
+                block_start = time.perf_counter()
 
                 # Adjust ranges for different types of workers
                 if num_workers == 8:
@@ -42,7 +78,7 @@ def master(scalability_tests, output_file):
                         else:  # Next 4 workers (Pi Zero)
                             start = int((i - 5) * (total_count * 0.05) + (total_count * 0.8))
                             end = int(start + (total_count * 0.05))
-                        comm.send((start, end), dest=i, tag=0)
+                        comm.send((start, end, repetitions), dest=i, tag=0)
                 elif num_workers == 16:
                     for i in range(1, num_workers + 1):
                         if i <= 4 or (7 <= i <= 11):  # First 4 and workers 7 to 11 (Pi 4)
@@ -59,292 +95,338 @@ def master(scalability_tests, output_file):
                             else:
                                 start = int((i - 12) * (total_count * 0.025) + (total_count * 0.8))
                                 end = int(start + (total_count * 0.025))
-                        comm.send((start, end), dest=i, tag=0)
+                        comm.send((start, end, repetitions), dest=i, tag=0)
                 else:
                     range_per_worker = total_count // num_workers
                     for i in range(1, num_workers + 1):
                         start = (i - 1) * range_per_worker
                         end = start + range_per_worker if i < num_workers else total_count
-                        comm.send((start, end), dest=i, tag=0)
+                        comm.send((start, end, repetitions), dest=i, tag=0)
 
                 # Collect results from each worker
-                total_primes = sum(comm.recv(source=i, tag=1) for i in range(1, num_workers + 1))
-                duration = time.time() - start_time
+                results = gatherer.gather(comm, num_workers, f'{num_workers}w_{total_count}')
+                block_ms = (time.perf_counter() - block_start) * 1000
+
+                for repetition in range(repetitions):
+                    runs = [result['repetitions'][repetition] for result in results]
+                    telemetry = [result['telemetry'][repetition] for result in results]
+                    total_primes = sum(count for count, _, _ in runs)
+                    # Slowest worker, measured on its own clock so hosts stay comparable
+                    duration = max(end - start for _, start, end in runs)
 
-                # Write to CSV
-                file.write(f'{total_primes}, {total_count}, {num_workers}, {duration * 1000}\n')
-                logging.info(f'Written results for {num_workers} workers and range {total_count} to {output_file}')
+                    # Write to CSV
+                    file.write(', '.join(str(value) for value in [total_primes, total_count, num_workers, duration * 1000, block_ms] + telemetry_row(telemetry)) + '\n')
+                    log_throttling(telemetry, f'repetition {repetition + 1} of {num_workers} workers and range {total_count}')
+                logging.info(f'Written results of {repetitions} repetitions for {num_workers} workers and range {total_count} to {output_file}')
+
+            gatherer.finish()
 
     except Exception as e:
         logging.error(f'Failed to write to CSV file: {e}')
 
-def worker():
-    comm = MPI.COMM_WORLD
+def worker(comm=None, wtime=None):
+    comm = MPI.COMM_WORLD if comm is None else comm
+    wtime = MPI.Wtime if wtime is None else wtime
+    sampler = TelemetrySampler()
+    # The benchmarked kernel stays the default; the tuned one has to be asked for
+    kernel, kernel_params = compute_primes, {}
+    if tuned_kernels_enabled():
+        from kernel_profile import load_kernel_params
+        kernel, kernel_params = compute_primes_segmented, load_kernel_params('primes')
+    # The profiler runs for the whole receive loop; each result carries the
+    # stacks collected since the previous one (waiting, computing, pickling)
+    profiler = None
+    if profiling_enabled():
+        from profiler import StackSampler
+        profiler = StackSampler()
+        profiler.start()
+    first_task = True
     while True:
-        start, end = comm.recv(source=0, tag=0)
-        total_primes = compute_primes(start, end)
-        comm.send(total_primes, dest=0, tag=1)
+        start, end, repetitions = comm.recv(source=0, tag=0)
+        if first_task:
+            startup_timer.mark('first_task')
+        # Run the repetitions back to back, one (count, start, end) and one telemetry
+        # summary per repetition; the sampler starts and stops outside the timed span
+        runs, telemetry = [], []
+        for _ in range(repetitions):
+            sampler.start()
+            run_start = wtime()
+            total_primes = kernel(start, end, **kernel_params)
+            runs.append((total_primes, run_start, wtime()))
+            telemetry.append(sampler.stop())
+        result = {'repetitions': runs, 'telemetry': telemetry}
+        if profiler is not None:
+            result['profile'] = profiler.drain()
+        if first_task:
+            result['startup'] = startup_timer.report(comm.Get_rank())
+            first_task = False
+        comm.send(result, dest=0, tag=1)
+
+# Define your scalability tests here
+scalability_tests_strong = [
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 2},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 4},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 8},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 10000, 'workers': 16},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 2},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 4},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 8},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 100000, 'workers': 16},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 1},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 2},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 4},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 8},
+    {'range': 1000000, 'workers': 16},
+    {'range': 1000000, 'workers': 16},
+    {'range': 1000000, 'workers': 16},
+    {'range': 1000000, 'workers': 16},
+    {'range': 1000000, 'workers': 16},
+    {'range': 1000000, 'workers': 16},
+    {'range': 0000000, 'workers': 16},
+    {'range': 1000000, 'workers': 16},
+    {'range': 1000000, 'workers': 16},
+    {'range': 1000000, 'workers': 16}
+]
+scalability_tests_weak = [
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 10000, 'workers': 1},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 20000, 'workers': 2},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 40000, 'workers': 4},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 80000, 'workers': 8},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 160000, 'workers': 16},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 100000, 'workers': 1},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 200000, 'workers': 2},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 400000, 'workers': 4},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 800000, 'workers': 8},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16},
+    {'range': 1600000, 'workers': 16}
+]
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if MPI is None:
+        raise SystemExit('mpi4py is required to run the sweep (emulator.py --mode local runs it without MPI)')
     comm = MPI.COMM_WORLD
     rank = comm.Get_rank()
 
-    # Define your scalability tests here
-    scalability_tests_strong = [
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 2},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 4},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 8},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 10000, 'workers': 16},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 2},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 4},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 8},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 100000, 'workers': 16},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 1},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 2},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 4},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 8},
-        {'range': 1000000, 'workers': 16},
-        {'range': 1000000, 'workers': 16},
-        {'range': 1000000, 'workers': 16},
-        {'range': 1000000, 'workers': 16},
-        {'range': 1000000, 'workers': 16},
-        {'range': 1000000, 'workers': 16},
-        {'range': 0000000, 'workers': 16},
-        {'range': 1000000, 'workers': 16},
-        {'range': 1000000, 'workers': 16},
-        {'range': 1000000, 'workers': 16}
-    ]
-    scalability_tests_weak = [
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 10000, 'workers': 1},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 20000, 'workers': 2},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 40000, 'workers': 4},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 80000, 'workers': 8},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 160000, 'workers': 16},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 100000, 'workers': 1},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 200000, 'workers': 2},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 400000, 'workers': 4},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 800000, 'workers': 8},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16},
-        {'range': 1600000, 'workers': 16}
-    ]
-
     output_dir = '/home/moi/output'
     #output_file = os.path.join(output_dir, 'prime_scalability_results_strong.csv')
     output_file2 = os.path.join(output_dir, 'prime_scalability_results_weak.csv')
@@ -0,0 +1,118 @@
+import csv
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})'
+
+class StackSampler:
+    # Samples the stack of the thread that created it from a background thread
+    # and keeps the result as collapsed stacks (one "a;b;c" key per distinct stack).
+    def __init__(self, interval=None):
+        if interval is None:
+            interval = float(os.environ.get('PROFILE_INTERVAL', '0.005'))
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._reset()
+
+    def _reset(self):
+        self.stacks = Counter()
+        self.samples = 0
+        self.overhead = 0.0
+        self.started = time.perf_counter()
+
+    def sample(self):
+        begin = time.perf_counter()
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is not None:
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            with self._lock:
+                self.stacks[';'.join(reversed(stack))] += 1
+                self.samples += 1
+        with self._lock:
+            self.overhead += time.perf_counter() - begin
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self._reset()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def drain(self):
+        # Hand over everything collected since the last drain and start afresh
+        with self._lock:
+            profile = {
+                'host': socket.gethostname(),
+                'stacks': dict(self.stacks),
+                'samples': self.samples,
+                'overhead_s': self.overhead,
+                'wall_s': time.perf_counter() - self.started,
+            }
+            self._reset()
+        return profile
+
+def write_collapsed(path, stacks):
+    with open(path, 'w') as file:
+        for stack, count in sorted(stacks.items()):
+            file.write(f'{stack} {count}\n')
+
+class ProfileCollector:
+    # Merges the profiles shipped by the workers into collapsed-stack files that
+    # flamegraph.pl, inferno or speedscope turn into flame graphs:
+    #   test_<n>_<label>.folded  all ranks of one test, rooted at their host
+    #   node_<host>.folded       every test run on that host
+    #   overhead.csv             sampler cost per host
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.tests = 0
+        self.nodes = {}
+        self.overhead = {}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def add_test(self, label, profiles):
+        self.tests += 1
+        merged = Counter()
+        for profile in profiles:
+            host = profile['host']
+            merged.update({f'{host};{stack}': count for stack, count in profile['stacks'].items()})
+            self.nodes.setdefault(host, Counter()).update(profile['stacks'])
+            totals = self.overhead.setdefault(host, [0, 0.0, 0.0])
+            totals[0] += profile['samples']
+            totals[1] += profile['overhead_s']
+            totals[2] += profile['wall_s']
+        write_collapsed(os.path.join(self.output_dir, f'test_{self.tests:03d}_{label}.folded'), merged)
+
+    def finish(self):
+        for host, stacks in self.nodes.items():
+            write_collapsed(os.path.join(self.output_dir, f'node_{host}.folded'), stacks)
+
+        with open(os.path.join(self.output_dir, 'overhead.csv'), 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['Host', 'Samples', 'SamplerTime(ms)', 'WallTime(ms)', 'Overhead(%)'])
+            for host, (samples, overhead, wall) in sorted(self.overhead.items()):
+                percent = 100.0 * overhead / wall if wall > 0 else 0.0
+                writer.writerow([host, samples, overhead * 1000, wall * 1000, percent])
+                logging.info(f'Profiler overhead on {host}: {percent:.2f}% ({samples} samples)')
+        logging.info(f'Written flame graph stacks for {self.tests} tests to {self.output_dir}')
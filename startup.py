@@ -0,0 +1,105 @@
+import logging
+import os
+import time
+
+# startup.py is the first thing both scripts import, so it stays cheap to load:
+# the opt-in features are switched on here and their modules are only imported
+# by the ranks that use them, and the host name comes from uname rather than
+# the socket module.
+
+# Opt in with PROFILE_WORKERS=1 (export it to every rank, e.g. `mpirun -x PROFILE_WORKERS`)
+def profiling_enabled():
+    return os.environ.get('PROFILE_WORKERS', '0') not in ('', '0', 'false', 'no')
+
+# The tuned kernels change what a sweep measures, so workers only use them with TUNED_KERNELS=1
+def tuned_kernels_enabled():
+    return os.environ.get('TUNED_KERNELS', '0') not in ('', '0', 'false', 'no')
+
+# Milestones of a rank's start-up, in the order they happen
+STARTUP_MARKS = ['script_start', 'imports', 'mpi_init', 'first_task']
+STARTUP_COLUMNS = ['Rank', 'Host', 'ProcessStart', 'ScriptStart(ms)', 'ImportsDone(ms)', 'MPIInitDone(ms)', 'FirstTask(ms)']
+
+def process_start_time():
+    # Wall-clock time the process was created, from /proc (None elsewhere).
+    # Uses the uptime rather than btime, which only has a one-second resolution.
+    try:
+        with open('/proc/self/stat') as file:
+            start_ticks = int(file.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as file:
+            uptime = float(file.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return time.time() - (uptime - start_ticks / os.sysconf('SC_CLK_TCK'))
+
+class StartupTimer:
+    def __init__(self):
+        self.marks = {'script_start': time.time()}
+        self.process_start = process_start_time()
+
+    def mark(self, name):
+        self.marks.setdefault(name, time.time())
+
+    def report(self, rank):
+        # Every milestone in milliseconds since the process was created
+        origin = self.process_start or self.marks['script_start']
+        return {
+            'rank': rank,
+            'host': os.uname().nodename,
+            'process_start': origin,
+            'marks': {name: (stamp - origin) * 1000 for name, stamp in self.marks.items()},
+        }
+
+def write_startup_report(path, reports):
+    # Only the master writes the report, so only it pays for the csv module
+    import csv
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(STARTUP_COLUMNS)
+        for rank in sorted(reports):
+            report = reports[rank]
+            writer.writerow([rank, report['host'], report['process_start']]
+                            + [report['marks'].get(name, '') for name in STARTUP_MARKS])
+
+    workers = [report for rank, report in reports.items() if rank != 0 and 'first_task' in report['marks']]
+    if workers:
+        slowest = max(workers, key=lambda report: report['marks']['first_task'])
+        logging.info(f'Start-up of {len(workers)} workers: slowest got its first task {slowest["marks"]["first_task"]:.0f} ms '
+                     f'after launch (rank {slowest["rank"]} on {slowest["host"]}), written to {path}')
+
+def repetition_blocks(scalability_tests):
+    # Consecutive identical tests are repetitions of one configuration
+    blocks = []
+    for test in scalability_tests:
+        if blocks and blocks[-1][0] == test:
+            blocks[-1][1] += 1
+        else:
+            blocks.append([test, 1])
+    return blocks
+
+class ResultGatherer:
+    # Receives the workers' results of each block on the master and keeps what
+    # they carry besides the repetitions: each rank's start-up report (sent with
+    # its first result) and, with PROFILE_WORKERS=1, the stacks of the block.
+    # finish() writes <results>_startup.csv and the <results>_profiles/ files.
+    def __init__(self, output_file, master_report):
+        self.output_file = output_file
+        self.startup_reports = {0: master_report}
+        self.collector = None
+
+    def gather(self, comm, num_workers, label):
+        results = [comm.recv(source=i, tag=1) for i in range(1, num_workers + 1)]
+        for rank, result in enumerate(results, start=1):
+            if 'startup' in result:
+                self.startup_reports[rank] = result['startup']
+
+        if 'profile' in results[0]:
+            if self.collector is None:
+                from profiler import ProfileCollector
+                self.collector = ProfileCollector(os.path.splitext(self.output_file)[0] + '_profiles')
+            self.collector.add_test(label, [result['profile'] for result in results])
+        return results
+
+    def finish(self):
+        if self.collector is not None:
+            self.collector.finish()
+        write_startup_report(os.path.splitext(self.output_file)[0] + '_startup.csv', self.startup_reports)
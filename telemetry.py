@@ -0,0 +1,164 @@
+import logging
+import os
+import threading
+
+# Where each metric is read from. Every path is resolved under TELEMETRY_ROOT
+# so a fake /proc + /sys tree can be used instead of the real one.
+DEFAULT_PATHS = {
+    'stat': '/proc/stat',
+    'status': '/proc/self/status',
+    'cpu_freq': '/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq',
+    'temperature': '/sys/class/thermal/thermal_zone0/temp',
+    'throttled': '/sys/devices/platform/soc/soc:firmware/get_throttled',
+}
+
+# Bits of the Pi firmware throttled word that describe the *current* state
+# (under-voltage, ARM frequency capped, currently throttled, soft temp limit)
+THROTTLED_NOW_MASK = 0xF
+
+def telemetry_paths(root=None, overrides=None):
+    if root is None:
+        root = os.environ.get('TELEMETRY_ROOT', '/')
+    paths = dict(DEFAULT_PATHS)
+    if overrides:
+        paths.update(overrides)
+    return {key: os.path.join(root, path.lstrip('/')) for key, path in paths.items()}
+
+def _read(path):
+    try:
+        with open(path) as file:
+            return file.read()
+    except OSError:
+        return None
+
+def read_cpu_times(path):
+    content = _read(path)
+    if content is None:
+        return None
+    for line in content.splitlines():
+        if line.startswith('cpu '):
+            fields = [int(value) for value in line.split()[1:]]
+            idle = fields[3] + (fields[4] if len(fields) > 4 else 0)  # idle + iowait
+            return sum(fields), idle
+    return None
+
+def read_rss_kb(path):
+    content = _read(path)
+    if content is None:
+        return None
+    for line in content.splitlines():
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1])
+    return None
+
+def read_int(path, base=10):
+    content = _read(path)
+    if content is None:
+        return None
+    try:
+        return int(content.strip(), base)
+    except ValueError:
+        return None
+
+class TelemetrySampler:
+    def __init__(self, interval=None, root=None, paths=None):
+        if interval is None:
+            interval = float(os.environ.get('TELEMETRY_INTERVAL', '0.1'))
+        self.interval = interval
+        self.paths = telemetry_paths(root, paths)
+        self._stop = threading.Event()
+        self._thread = None
+        self._reset()
+
+    def _reset(self):
+        self.samples = []
+        self._first_cpu = None
+        self._last_cpu = None
+
+    def sample(self):
+        cpu = read_cpu_times(self.paths['stat'])
+        if cpu is not None:
+            if self._first_cpu is None:
+                self._first_cpu = cpu
+            self._last_cpu = cpu
+        freq_khz = read_int(self.paths['cpu_freq'])
+        temp_millic = read_int(self.paths['temperature'])
+        self.samples.append({
+            'freq_mhz': freq_khz / 1000 if freq_khz is not None else None,
+            'temp_c': temp_millic / 1000 if temp_millic is not None else None,
+            'throttled': read_int(self.paths['throttled'], 16),
+            'rss_kb': read_rss_kb(self.paths['status']),
+        })
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self._reset()
+        self._stop.clear()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.sample()
+        return self.summary()
+
+    def summary(self):
+        def values(key):
+            return [s[key] for s in self.samples if s[key] is not None]
+
+        cpu_util = None
+        if self._first_cpu is not None and self._last_cpu is not None:
+            total = self._last_cpu[0] - self._first_cpu[0]
+            idle = self._last_cpu[1] - self._first_cpu[1]
+            if total > 0:
+                cpu_util = 100.0 * (total - idle) / total
+
+        freqs, temps, rss = values('freq_mhz'), values('temp_c'), values('rss_kb')
+        throttled = values('throttled')
+        throttled_word = 0
+        for word in throttled:
+            throttled_word |= word
+        return {
+            'host': os.uname().nodename,
+            'samples': len(self.samples),
+            'cpu_util': cpu_util,
+            'freq_min_mhz': min(freqs) if freqs else None,
+            'freq_mean_mhz': sum(freqs) / len(freqs) if freqs else None,
+            'temp_max_c': max(temps) if temps else None,
+            'throttled': (throttled_word & THROTTLED_NOW_MASK) != 0 if throttled else None,
+            'throttled_word': throttled_word if throttled else None,
+            'rss_max_kb': max(rss) if rss else None,
+        }
+
+TELEMETRY_COLUMNS = ['CpuUtilMean(%)', 'CpuFreqMin(MHz)', 'TempMax(C)', 'ThrottledRanks', 'RssMax(KB)']
+
+def telemetry_row(summaries):
+    # Collapse the per-rank summaries of one test into the CSV columns above
+    def values(key):
+        return [s[key] for s in summaries if s and s.get(key) is not None]
+
+    cpu_util, freqs, temps, rss = values('cpu_util'), values('freq_min_mhz'), values('temp_max_c'), values('rss_max_kb')
+    throttled_ranks = [str(rank) for rank, s in enumerate(summaries, start=1) if s and s.get('throttled')]
+    return [
+        round(sum(cpu_util) / len(cpu_util), 1) if cpu_util else '',
+        min(freqs) if freqs else '',
+        max(temps) if temps else '',
+        ' '.join(throttled_ranks),
+        max(rss) if rss else '',
+    ]
+
+def log_throttling(summaries, label):
+    throttled = []
+    for rank, s in enumerate(summaries, start=1):
+        if s and s.get('throttled'):
+            temperature = f", {s['temp_max_c']} C" if s.get('temp_max_c') is not None else ''
+            throttled.append(f"rank {rank} on {s['host']} (0x{s['throttled_word']:x}{temperature})")
+    if throttled:
+        logging.warning(f'Throttling during {label}: ' + ', '.join(throttled))